@@ -5,7 +5,7 @@
 # Standard library imports
 import logging
 import time
-from typing import Tuple
+from typing import Tuple, Union
 
 # Third party imports
 from myhargassner.pubsub.pubsub import PubSub
@@ -13,6 +13,32 @@ from myhargassner.pubsub.pubsub import PubSub
 # Project imports
 import myhargassner.hargconfig as hargconfig
 
+# requests sent by the IGW, grouped by their first 4 characters.
+# Within a group, a prefix is listed before the shorter ones it starts with
+_REQUEST_PREFIXES: dict[str, Tuple[str, ...]] = {
+    '$log': ('$login token', '$login key', '$logging disable', '$logging enable'),
+    '$api': ('$apiversion',),
+    '$set': ('$setkomm',),
+    '$asn': ('$asnr get',),
+    '$igw': ('$igw set', '$igw clear'),
+    '$daq': ('$daq stop', '$daq desc', '$daq start'),
+    '$boo': ('$bootversion',),
+    '$inf': ('$info',),
+    '$upt': ('$uptime',),
+    '$rtc': ('$rtc get',),
+    '$par': ('$par get all', '$par get changed', '$par get'),
+    '$err': ('$erract',),
+}
+
+# lines of the $info response, up to their ':', and the value published for each
+_INFO_KEYS: dict[str, str] = {
+    '$KT': 'KT',
+    '$SWV': 'SWV',
+    '$FWV I/O': 'FWV',
+    '$SN I/O': 'SNIO',
+    '$SN BCE': 'SNBCE',
+}
+
 class Analyser():
     """
     analyser for the dialog with boiler
@@ -21,15 +47,19 @@ class Analyser():
     _channel= "info" # Channel to publish discoverd info about the boiler (from the dialog between gateway and boiler)
     _com: PubSub # every data receiver should have a PubSub communicator
 
-    _pmstamp: float = 0.0
-    _values: dict # telnet pm values
-    _pm: bytes = b''
+    _pmstamp: float = 0.0 # time.monotonic() of the last pm buffer analysed, 0 before the first one
+    _values: dict # telnet pm values, as received
+    _pm_fields: list # (pm field position, value name) of the mapped fields, by position
+    _pm: bytearray # pm buffer being received, it can span several reads
 
     def __init__(self, communicator: PubSub) -> None:
         self._com = communicator
 
         self._values= {}
+        self._pm = bytearray()
         self.config= hargconfig.HargConfig()
+        # only the fields in config.map are compared and published
+        self._pm_fields = sorted(self.config.map.items())
 
     def push(self, key: str, subpart: str):
         """
@@ -39,15 +69,11 @@ class Analyser():
 
     def is_pm_response(self, _data: bytes) -> bool:
         """check if the data is a pm response"""
-        if len(_data)>1 and repr(_data[0:2])=="b'pm'":
-            return True
-        return False
+        return _data.startswith(b'pm')
 
     def is_daq_desc(self, _buffer: bytes) -> bool:
         """check if the data is a daq description"""
-        if len(_buffer)>4 and repr(_buffer[0:4]) == "b'$<<<'":
-            return True
-        return False
+        return len(_buffer) > 4 and _buffer.startswith(b'$<<<')
 
     def parse_request(self, data: bytes) -> Tuple[str, bool]:
         """parse the telnet request
@@ -65,92 +91,45 @@ class Analyser():
         _session_end_requested: bool = False
 
         #log verbose the request except for $setkomm and $erract which occur too frequently
-        if b'$setkomm' not in data and b'$erract' not in data:
+        if (logging.getLogger().isEnabledFor(15)
+                and b'$setkomm' not in data and b'$erract' not in data):
             logging.log(15, 'Analyser: request=%s', repr(data))
         _str_parts = data.decode('ascii').split('\r\n')
         for _part in _str_parts:
             #logging.debug('_part=%s',_part)
-            if _part.startswith('$login token'):
-                logging.debug('$login token detected')
-                _state = '$login token'
-            elif _part.startswith('$login key'):
-                logging.debug('$login key detected')
-                _state = '$login key'
+            # all request prefixes start with '$' and differ in their first 4 characters
+            # but for a few, so only the prefixes sharing those are tested
+            for _prefix in _REQUEST_PREFIXES.get(_part[:4], ()):
+                if _part.startswith(_prefix):
+                    _state = _prefix
+                    break
+            else:
+                if _part == '':
+                    continue
+                logging.debug('Analyser received unhandled request %s - treating as passthrough', _part)
+                _state = 'passthrough'  # mark it as passthrough
+                continue
+            if _state == '$igw clear':
+                logging.info('$igw clear detected - session end requested')
+                _session_end_requested = True
+                continue
+            logging.debug('%s detected', _state)
+            if _state == '$login key':
                 _subpart = _part[11:]
                 self.push('KEY', _subpart)
-            elif _part.startswith('$apiversion'):
-                logging.debug('$apiversion detected')
-                _state = '$apiversion'
-            elif _part.startswith('$setkomm'):
-                logging.debug('$setkomm detected')
-                _state = '$setkomm'
-            elif _part.startswith('$asnr get'):
-                logging.debug('$asnr get detected')
-                _state = '$asnr get'
-            elif _part.startswith('$igw set'):
-                logging.debug('$igw set detected')
-                _state = '$igw set'
+            elif _state == '$igw set':
                 _subpart = _part[9:]
                 self.push('IGW', _subpart)
-            elif _part.startswith('$igw clear'):
-                logging.info('$igw clear detected - session end requested')
-                _state = '$igw clear'
-                _session_end_requested = True
-            elif _part.startswith('$daq stop'):
-                logging.debug('$daq stop detected')
-                _state = '$daq stop'
-            elif _part.startswith('$logging disable'):
-                logging.debug('$logging disable detected')
-                _state = '$logging disable'
-            elif _part.startswith('$daq desc'):
-                logging.debug('$daq desc detected')
-                _state = '$daq desc'
-            elif _part.startswith('$daq start'):
-                logging.debug('$daq start detected')
-                _state = '$daq start'
-            elif _part.startswith('$logging enable'):
-                logging.debug('$logging enable detected')
-                _state = '$logging enable'
-            elif _part.startswith('$bootversion'):
-                logging.debug('$bootversion detected')
-                _state = '$bootversion'
-            elif _part.startswith('$info'):
-                logging.debug('$info detected')
-                _state = '$info'
-            elif _part.startswith('$uptime'):
-                logging.debug('$uptime detected')
-                _state = '$uptime'
-            elif _part.startswith('$rtc get'):
-                logging.debug('$rtc get detected')
-                _state = '$rtc get'
-            elif _part.startswith('$par get all'):
-                logging.debug('$par get all detected')
-                _state = '$par get all'
-            elif _part.startswith('$par get changed'):
-                logging.debug('$par get changed detected')
-                _state = '$par get changed'
-            elif _part.startswith('$par get'): # $par get %d
-                logging.debug('$par get detected')
-                _state = '$par get'
-            elif _part.startswith('$erract'):
-                logging.debug('$erract detected')
-                _state = '$erract'
-            elif _part == '':
-                #logging.debug('empty _part')
-                pass
-            else:
-                logging.debug('Analyser received unhandled request %s - treating as passthrough', _part)
-                _state = 'passthrough'  # mark it as passthrough
         logging.debug('_state/_part: %s/%s', _state, _part)
         return _state, _session_end_requested
 
-    def _parse_response_buffer(self, state: str, buffer: bytes,
+    def _parse_response_buffer(self, state: str, buffer: str,
                                session_end_requested: bool = False) -> Tuple[str, bool, bool]:
         """parse the response buffer sent by boiler
 
         Args:
             state: Current request state
-            buffer: Response buffer from boiler
+            buffer: Response buffer from boiler, decoded as latin-1
             session_end_requested: True if waiting for $igw clear response
 
         Returns:
@@ -166,9 +145,11 @@ class Analyser():
         logging.debug('Analyser.parse_response_buffer _state=%s', _state)
         if _state == 'passthrough':
             logging.warning('New response (passthrough) %s', repr(buffer))
-        _str_parts= repr(buffer)[2:-1].split('\\r\\n')
+        _str_parts= buffer.split('\r\n')
+        _debug = logging.getLogger().isEnabledFor(logging.DEBUG)
         for _part in _str_parts:
-            logging.debug('part %d:[%s]', len(_part), _part)
+            if _debug:
+                logging.debug('part %d:[%s]', len(_part), _part)
             if _state == '$login token':
                 # $wwxxyyzz
                 _subpart = _part[1:]
@@ -240,27 +221,15 @@ class Analyser():
                     self.push('BOOT', _subpart)
                     _state = ''
             elif _state == '$info':
-                if _part.startswith('$KT:'):
-                    logging.debug('$KT $ack detected')
-                    _subpart = _part[5:]
-                    self.push('KT', _subpart)
-                if _part.startswith('$SWV:'):
-                    logging.debug('$SWV $ack detected')
-                    _subpart = _part[6:]
-                    self.push('SWV', _subpart)
-                if _part.startswith('$FWV I/O:'):
-                    logging.debug('$FWV I/O $ack detected')
-                    _subpart = _part[10:]
-                    self.push('FWV', _subpart)
-                if _part.startswith('$SN I/O:'):
-                    logging.debug('$SN I/O $ack detected')
-                    _subpart = _part[9:]
-                    self.push('SNIO', _subpart)
-                if _part.startswith('$SN BCE:'):
-                    logging.debug('$SN BCE $ack detected')
-                    _subpart = _part[9:]
-                    self.push('SNBCE', _subpart)
-                    _state = ''
+                # $KT: <model>, one line per value, $SN BCE: is the last one
+                _head, _sep, _subpart = _part.partition(':')
+                _key = _INFO_KEYS.get(_head) if _sep else None
+                if _key is not None:
+                    logging.debug('%s $ack detected', _head)
+                    # the value follows ': '
+                    self.push(_key, _subpart[1:])
+                    if _key == 'SNBCE':
+                        _state = ''
             elif _state == '$uptime':
                 if _part.startswith('$'):
                     logging.debug('$uptime $ack detected')
@@ -294,22 +263,31 @@ class Analyser():
                 _state = ''
         return _state, _login_done, _session_end_complete
 
-    def analyse_pm(self, pm: bytes):
+    def analyse_pm(self, pm: Union[bytes, bytearray]):
         """
         analyse the pm buffer regularly sent by the boiler and publish what's found
         """
-        _part: str = ''
-        i: int = -1
-        _str_parts: list[str] = []
-        logging.debug('analyse_pm %d bytes ==>%s',len(pm), repr(pm))
-        _str_parts = pm.decode('ascii').split(' ')
-        for _part in _str_parts:
-            if ((i in self._values) and (_part != self._values[i])) or (i not in self._values):
-                self._values[i]= _part
-                if i in self.config.map:
-                    logging.debug('pm %s --> %s', self.config.map[i],_part)
-                    self.push(self.config.map[i], _part)
-            i=i+1
+        _part: bytes = b''
+        _parts: list = []
+        _values = self._values
+        # checked once per pm buffer, the repr() and the per-field logging are skipped unless DEBUG
+        _debug = logging.getLogger().isEnabledFor(logging.DEBUG)
+        if _debug:
+            logging.debug('analyse_pm %d bytes ==>%s',len(pm), repr(pm))
+        # the fields are compared as bytes, only the changed ones are decoded
+        _parts = pm.split(b' ')
+        # field 0 follows the 'pm' header
+        _count = len(_parts) - 1
+        for i, _key in self._pm_fields:
+            if i >= _count:
+                break
+            _part = _parts[i + 1]
+            if _values.get(i) != _part:
+                _values[i]= _part
+                _value = _part.decode('ascii')
+                if _debug:
+                    logging.debug('pm %s --> %s', _key, _value)
+                self.push(_key, _value)
 
     def analyse_data_buffer(self, _data: bytes,
                                buffer: bytes,
@@ -340,18 +318,20 @@ class Analyser():
         if self.is_pm_response(_data):
             logging.debug('pm response detected')
             _mode= 'pm'
+            # a new pm buffer starts: drop any unfinished one left from a previous read
+            self._pm.clear()
 
         if _mode == 'pm':
+            # extended in place: a pm buffer split over several reads is not copied again for each part
+            self._pm += _data
             if _data[-2:] == b'\r\n':
-                _time= time.time()
+                _time= time.monotonic()
                 if (self._pmstamp == 0) or ((_time - self._pmstamp) > self.config.scan):
-                    self._pm = _data
                     self._pmstamp = _time
                     logging.debug('pm full buffer detected (%d bytes)',len(self._pm))
                     self.analyse_pm(self._pm)
+                self._pm.clear()
                 _mode = ''
-            else:
-                self._pm = self._pm + _data
             return _buffer, _mode, _state, False, False
 
         #here _mode is not 'pm'
@@ -365,17 +345,20 @@ class Analyser():
             _buffer = _data
 
         if _buffer[-2:] == b'\r\n':
-            logging.debug('buffer complete (%d bytes): %s',len(_buffer), repr(_buffer))
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug('buffer complete (%d bytes): %s',len(_buffer), repr(_buffer))
             _mode = '' # revert to normal mode for next data
             if self.is_daq_desc(_buffer):
                 logging.log(15, 'daq desc detected (%d bytes), skipped',len(_buffer))
                 # do not process daq desc further and reset _state for next request
                 _state= ''
             else:
+                # decoded once, for mqtt_actuator and for our own parsing
+                _text = _buffer.decode('latin-1')
                 # we will push the data to mqtt_actuator for further processing
-                self._com.publish("track", _buffer.decode('latin-1'))
+                self._com.publish("track", _text)
                 _state, _login_done, _session_end_complete = self._parse_response_buffer(
-                    _state, _buffer, session_end_requested)
+                    _state, _text, session_end_requested)
             _buffer = b'' #clear working buffer
         #return after processing _buffer
         return _buffer, _mode, _state, _login_done, _session_end_complete
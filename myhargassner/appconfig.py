@@ -3,10 +3,56 @@ AppConfig: Centralized configuration wrapper for MyHargassner
 Provides attribute access, type conversion, and validation helpers.
 """
 
+import atexit
 import logging
+import logging.handlers
 import argparse
+import queue
 import configparser
 import os
+from typing import Optional
+
+# config defaults, overridden by the config file and then by the CLI arguments.
+# Shared by all the instances, it is never modified
+DEFAULTS = {
+    'network': {
+        'gw_iface': 'eth0',
+        'bl_iface': '10.0.0.1',  # Use IP address to avoid SO_BINDTODEVICE issues
+        'udp_port': '35601',
+        'socket_timeout': '20.0',  # Socket recv/send timeout (seconds)
+        'buff_size': '4096'
+    },
+    'mqtt': {
+        'host': 'localhost',
+        'port': '1883',
+        'username': '',
+        # 'password' is required!
+        'topic_prefix': 'myhargassner'
+    },
+    'logging': {
+        'log_path': '/var/log/myhargassner.log',
+        'log_level': 'INFO'
+    },
+    'timeouts': {
+        # Shutdown responsiveness timeouts (all in seconds)
+        'loop_timeout': '1.0',        # Main loop timeout (select/MQTT) - determines shutdown responsiveness
+        'queue_timeout': '1.0',       # Message queue timeout for inter-component communication
+        'retry_delay': '5.0',         # Delay before retrying failed operations
+        'service_lock_delay': '1.0'   # Delay when service is locked/paused
+    }
+}
+
+VERBOSE = 15
+
+# accepted values of log_level, in lower case
+LOG_LEVELS = {
+    'debug': logging.DEBUG,
+    'verbose': VERBOSE,
+    'info': logging.INFO,
+    'warning': logging.WARNING,
+    'error': logging.ERROR,
+    'critical': logging.CRITICAL
+}
 
 class AppConfig:
     """
@@ -20,34 +66,9 @@ class AppConfig:
         Initialize AppConfig by loading defaults, parsing CLI arguments, reading the config file,
         and merging all sources into a unified configuration dictionary.
         """
-        # Set up config defaults
-        self.defaults = {
-            'network': {
-                'gw_iface': 'eth0',
-                'bl_iface': '10.0.0.1',  # Use IP address to avoid SO_BINDTODEVICE issues
-                'udp_port': '35601',
-                'socket_timeout': '20.0',  # Socket recv/send timeout (seconds)
-                'buff_size': '4096'
-            },
-            'mqtt': {
-                'host': 'localhost',
-                'port': '1883',
-                'username': '',
-                # 'password' is required!
-                'topic_prefix': 'myhargassner'
-            },
-            'logging': {
-                'log_path': '/var/log/myhargassner.log',
-                'log_level': 'INFO'
-            },
-            'timeouts': {
-                # Shutdown responsiveness timeouts (all in seconds)
-                'loop_timeout': '1.0',        # Main loop timeout (select/MQTT) - determines shutdown responsiveness
-                'queue_timeout': '1.0',       # Message queue timeout for inter-component communication
-                'retry_delay': '5.0',         # Delay before retrying failed operations
-                'service_lock_delay': '1.0'   # Delay when service is locked/paused
-            }
-        }
+        self.defaults = DEFAULTS
+
+        self._log_listener: Optional[logging.handlers.QueueListener] = None
 
         # Parse CLI args
         parser = argparse.ArgumentParser()
@@ -58,22 +79,27 @@ class AppConfig:
         parser.add_argument('-c', '--critical', action='store_true', help='critical logging level')
         for section, options in self.defaults.items():
             for key in options:
-                parser.add_argument(f'--{key}', dest=f'{section}_{key}')
+                if key == 'log_level':
+                    parser.add_argument(f'--{key}', dest=f'{section}_{key}',
+                                        type=str.lower, choices=list(LOG_LEVELS))
+                else:
+                    parser.add_argument(f'--{key}', dest=f'{section}_{key}')
         self.args = parser.parse_args()
 
         # Load config file
         self._config = configparser.ConfigParser()
         config_path = os.path.join(os.getcwd(), 'myhargassner.ini')
-        print("config_path=", config_path)
+        logging.debug('config_path=%s', config_path)
         self._config.read(config_path)
-        print("password=", self._config.get('mqtt', 'password', fallback='NOT SET'))
         # Merge defaults, then config file, then CLI args
         for section, options in self.defaults.items():
             if section not in self._config:
                 self._config[section] = {}
+            _section = self._config[section]
             for key, value in options.items():
-                if key not in self._config[section] or not self._config[section][key]:
-                    self._config[section][key] = value
+                # missing or empty in the config file
+                if not _section.get(key):
+                    _section[key] = value
         for arg, value in vars(self.args).items():
             if value is not None:
                 if '_' in arg:
@@ -83,13 +109,24 @@ class AppConfig:
                     else:
                         self._config[section] = {key: value}
 
+        # numeric values and interface names are converted once here: some are read in the select and recv loops
+        self._gw_iface = bytes(self.network.get('gw_iface', 'eth0'), 'ascii')
+        self._bl_iface = bytes(self.network.get('bl_iface', 'eth1'), 'ascii')
+        self._udp_port = int(self.network.get('udp_port', 35601))
+        self._socket_timeout = float(self.network.get('socket_timeout', 5))
+        self._buff_size = int(self.network.get('buff_size', 4096))
+        self._mqtt_port = int(self.mqtt.get('port', 1883))
+        self._loop_timeout = float(self.timeouts.get('loop_timeout', 1.0))
+        self._queue_timeout = float(self.timeouts.get('queue_timeout', 3.0))
+        self._retry_delay = float(self.timeouts.get('retry_delay', 5.0))
+        self._service_lock_delay = float(self.timeouts.get('service_lock_delay', 1.0))
+
     def setup_logging(self):
         """
         Configure the Python logging system using the log path and log level from the configuration.
         Uses a standard log message format and supports all standard log levels.
         """
 
-        VERBOSE = 15
         logging.addLevelName(VERBOSE, "VERBOSE")
 
         def _logger_verbose(self, msg, *args, **kwargs):
@@ -99,27 +136,38 @@ class AppConfig:
         # attach method to Logger class
         #logging.Logger.verbose = _logger_verbose
         setattr(logging.Logger, "verbose", _logger_verbose)  # type: ignore[attr-defined]
-        # ...existing code...
-        log_levels = {
-            'debug': logging.DEBUG,
-            'verbose': VERBOSE,
-            'info': logging.INFO,
-            'warning': logging.WARNING,
-            'error': logging.ERROR,
-            'critical': logging.CRITICAL
-        }
         log_level_str = self.log_level.lower()
-        log_level = log_levels.get(log_level_str, logging.INFO)
+        log_level = LOG_LEVELS.get(log_level_str, logging.INFO)
+        # the component threads only put records on a queue, a listener thread writes them to
+        # the file, so the network loops do not wait on disk I/O
+        if self._log_listener is not None:
+            atexit.unregister(self._log_listener.stop)
+            self._log_listener.stop()
+        file_handler = logging.FileHandler(self.log_path, mode='a')
+        file_handler.setFormatter(
+            logging.Formatter('%(asctime)s - %(levelname)s - %(threadName)s - %(message)s'))
+        log_queue: queue.Queue = queue.Queue(-1)
+        self._log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+        self._log_listener.start()
+        # stop() writes the records still queued when the process exits
+        atexit.register(self._log_listener.stop)
+        # the full format is applied by the listener's file handler. basicConfig() would give
+        # a handler without formatter the default '%(levelname)s:%(name)s:%(message)s', and
+        # QueueHandler.prepare() would write that into the queued message: the level and
+        # logger name would then appear twice in the file
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
         logging.basicConfig(
-            filename=self.log_path,
             level=log_level,
-            format='%(asctime)s - %(levelname)s - %(threadName)s - %(message)s',
-            filemode='a',
+            handlers=[queue_handler],
             force=True
         )
         # Set specific logger level
         logging.getLogger('ha_mqtt_discoverable').setLevel(logging.WARNING)
         logging.getLogger('paho.mqtt').setLevel(logging.WARNING)
+        if log_level_str not in LOG_LEVELS:
+            # only the config file can get here, argparse rejects unknown levels
+            logging.warning('Unknown log_level %s in config file, using INFO', self.log_level)
 
     @property
     def network(self):
@@ -155,7 +203,7 @@ class AppConfig:
         """
         Return the gateway network interface as bytes (e.g., b'eth0').
         """
-        return bytes(self.network.get('gw_iface', 'eth0'), 'ascii')
+        return self._gw_iface
 
     def gw_iface_str(self):
         """
@@ -167,7 +215,7 @@ class AppConfig:
         """
         Return the boiler network interface as bytes (e.g., b'eth1').
         """
-        return bytes(self.network.get('bl_iface', 'eth1'), 'ascii')
+        return self._bl_iface
 
     def bl_iface_str(self):
         """
@@ -179,21 +227,21 @@ class AppConfig:
         """
         Return the UDP port for gateway/boiler communication as an integer.
         """
-        return int(self.network.get('udp_port', 35601))
+        return self._udp_port
 
     @property
     def socket_timeout(self):
         """
         Return the socket timeout value as a float (seconds).
         """
-        return float(self.network.get('socket_timeout', 5))
+        return self._socket_timeout
 
     @property
     def buff_size(self):
         """
         Return the buffer size for network data as an integer (bytes).
         """
-        return int(self.network.get('buff_size', 4096))
+        return self._buff_size
 
     @property
     def mqtt_host(self):
@@ -207,7 +255,7 @@ class AppConfig:
         """
         Return the MQTT broker port as an integer.
         """
-        return int(self.mqtt.get('port', 1883))
+        return self._mqtt_port
 
     @property
     def mqtt_username(self):
@@ -253,7 +301,7 @@ class AppConfig:
         This value determines how responsive components are to shutdown requests.
         Lower values = faster shutdown but more CPU usage.
         """
-        return float(self.timeouts.get('loop_timeout', 1.0))
+        return self._loop_timeout
 
     def queue_timeout(self):
         """
@@ -261,7 +309,7 @@ class AppConfig:
         Used for inter-component communication via PubSub message queues.
         Applies to both discovery and normal operation phases.
         """
-        return float(self.timeouts.get('queue_timeout', 3.0))
+        return self._queue_timeout
 
     @property
     def retry_delay(self):
@@ -269,7 +317,7 @@ class AppConfig:
         Return the delay before retrying failed operations as a float (seconds).
         Used when connection attempts or restarts fail.
         """
-        return float(self.timeouts.get('retry_delay', 5.0))
+        return self._retry_delay
 
     @property
     def service_lock_delay(self):
@@ -277,6 +325,6 @@ class AppConfig:
         Return the delay when service is locked/paused as a float (seconds).
         Used when TelnetProxy service1 is waiting for lock release.
         """
-        return float(self.timeouts.get('service_lock_delay', 1.0))
+        return self._service_lock_delay
 
     # Add more helpers as needed for your project
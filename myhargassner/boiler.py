@@ -4,7 +4,7 @@ This module implements the boiler proxy
 
 # Standard library imports
 import logging
-from typing import Tuple
+from typing import Tuple, Union
 
 # Third party imports
 from myhargassner.pubsub.pubsub import PubSub
@@ -20,6 +20,9 @@ from myhargassner.socket_manager import (
     InterfaceError
 )
 
+# first bytes of the boiler UDP frame carrying the HSV and SYS strings
+HSV_HEADER = b'\x00\x02HSV'
+
 class BoilerListenerSender(ListenerSender):
     """
     This class implements the boiler proxy
@@ -61,7 +64,7 @@ class BoilerListenerSender(ListenerSender):
         logging.debug('Getting boiler resend port: %d', self.bl_port)
         return self.bl_port, 0
 
-    def send(self, data: bytes) -> None:
+    def send(self, data: Union[bytes, memoryview]) -> None:
         """Send data to the gateway using platform-aware socket management.
         
         Args:
@@ -128,21 +131,24 @@ class BoilerListenerSender(ListenerSender):
         except (SocketBindError, InterfaceError) as e:
             logging.error('Failed to bind listener: %s', str(e))
             raise
-    def handle_data(self, data: bytes, addr: tuple):
+    def handle_data(self, data: Union[bytes, memoryview], addr: tuple):
         """handle udp data"""
         _str: str = ''
         _subpart: str = ''
         _str_parts: list[str] = []
 
-        logging.debug('handle_data::received %d bytes from %s:%d ==>%s',
-                      len(data), addr[0], addr[1], data.decode())
-        if data.startswith(b'\x00\x02\x48\x53\x56'):
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug('handle_data::received %d bytes from %s:%d ==>%s',
+                          len(data), addr[0], addr[1], str(data, 'utf-8'))
+        # data can be a memoryview, which has no startswith()
+        if data[0:5] == HSV_HEADER:
             logging.info('HSV discovered')
-            logging.info('HSV=%s',data[2:32].decode())
+            logging.info('HSV=%s', str(data[2:32], 'utf-8'))
             # we do not publish HSV as it is not used by other components
             #self._com.publish(self._channel, f"HSV££{data[2:32].decode()}")
-            logging.info('SYS=%s',data[len(data)-16:len(data)].decode())
-            self._com.publish(self._channel, f"SYS££{data[len(data)-16:len(data)].decode()}")
+            _subpart = str(data[-16:], 'utf-8')
+            logging.info('SYS=%s', _subpart)
+            self._com.publish(self._channel, f"SYS££{_subpart}")
 
 class ThreadedBoilerListenerSender(ThreadedListenerSender):
     """
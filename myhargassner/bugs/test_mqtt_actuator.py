@@ -7,6 +7,7 @@ Mocks only the dependencies (telnet client and PubSub communicator).
 
 import logging
 import threading
+from queue import Empty
 from typing import Optional
 import re
 
@@ -150,6 +151,17 @@ class MockChanelQueue:
             yield {'data': config, 'id': 0}
         # Generator ends here (no more messages)
 
+    def get_message(self, block: bool = True, timeout: Optional[float] = None):
+        """
+        Mock get_message that provides boiler configuration once
+
+        Raises:
+            Empty: once the configuration has been provided
+        """
+        for message in self.listen(block, timeout):
+            return message
+        raise Empty
+
 
 class MockPubSub(PubSub):
     """Mock PubSub communicator that provides boiler configuration"""
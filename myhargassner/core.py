@@ -183,12 +183,11 @@ class ChanelReceiver(NetworkData, ABC):
             return
         try:
             logging.debug('handle: attempting to get next message')
-            # Use non-blocking listen with timeout for inter-component communication
-            iterator = self._msq.listen(timeout=self._appconfig.queue_timeout())
+            # Wait for one message with timeout for inter-component communication
             try:
-                _message = next(iterator)
+                _message = self._msq.get_message(timeout=self._appconfig.queue_timeout())
                 logging.debug('handle: received message from queue: %s', _message)
-            except StopIteration:
+            except Empty:
                 logging.debug('handle: no message available')
                 return
             if not _message or 'data' not in _message:
@@ -293,7 +292,7 @@ class ListenerSender(ShutdownAware, ChanelReceiver, ABC):
             logging.error('Failed to initialize sockets: %s', str(e))
             raise
 
-    def handle_first(self, data: bytes, addr: Tuple[str, int]) -> None: # pylint: disable=unused-argument
+    def handle_first(self, data: Union[bytes, memoryview], addr: Tuple[str, int]) -> None: # pylint: disable=unused-argument
         """
         This method handles the discovery of caller's ip address and port.
         """
@@ -327,7 +326,7 @@ class ListenerSender(ShutdownAware, ChanelReceiver, ABC):
         pass
 
     @abstractmethod
-    def send(self, data: bytes) -> None:
+    def send(self, data: Union[bytes, memoryview]) -> None:
         """
         This method resends received data to the destination.
         Must be implemented in the child class.
@@ -335,9 +334,10 @@ class ListenerSender(ShutdownAware, ChanelReceiver, ABC):
         pass
 
     @abstractmethod
-    def handle_data(self, data: bytes, addr: Tuple[str, int]) -> None:
+    def handle_data(self, data: Union[bytes, memoryview], addr: Tuple[str, int]) -> None:
         """
         This method handles received data.
+        data may be a memoryview on the receive buffer: it must not be kept after the call.
         Must be implemented in the child class.
         """
         pass
@@ -365,26 +365,26 @@ class ListenerSender(ShutdownAware, ChanelReceiver, ABC):
         """
         This method is the main loop of the class.
         """
-        data: bytes
+        data: memoryview
         addr: tuple
 
         if not self._bound:
             logging.error("Cannot start loop - socket not bound yet")
             return
         while not self._shutdown_requested:
-            if self._msq:
+            # qsize() takes the queue mutex, only call it when it is logged
+            if self._msq and logging.getLogger().isEnabledFor(logging.DEBUG):
                 logging.debug('ChannelQueue size: %d', self._msq.qsize())
             logging.debug('waiting data')
             # Initialize with empty values
-            data = b''  # Initialize as empty bytes instead of None
             addr = ('', 0)
 
             try:
                 # Use socket manager to receive data with built-in timeout
-                data, addr = self.listen_manager.receive()
+                # data is a view on the socket manager receive buffer, valid until the next receive
+                data, addr = self.listen_manager.receive_into()
                 if data:  # Only process if we actually got data
                     logging.log(15,'Received buffer of %d bytes from %s:%d', len(data), addr[0], addr[1])
-                    logging.debug('Data: %s', data)
 
                     # If destination is not yet discovered, handle first packet and bind the resend socket
                     if not self._resender_bound:
@@ -6,7 +6,7 @@ and forwards messages from the IGW to the boiler.
 
 # Standard library imports
 import logging
-from typing import Annotated, Tuple
+from typing import Annotated, Tuple, Union
 
 # Third party imports
 import annotated_types
@@ -24,6 +24,11 @@ from myhargassner.socket_manager import (
 
 # pylint: disable=logging-fstring-interpolation
 
+# kernel receive buffer requested for the gateway listener, so bursts are not
+# dropped while the consumers drain their queues
+RCVBUF_SIZE = 8 * 1024 * 1024
+RCVBUF_MIN = 2 * 1024 * 1024
+
 class GatewayListenerSender(ListenerSender):
     """
     This class extends ListenerSender class to implement the gateway listener.
@@ -74,7 +79,7 @@ class GatewayListenerSender(ListenerSender):
         logging.debug('Getting gateway resend port: %d delta:%d', self.gw_port, -self.delta)
         return self.gw_port, -self.delta
 
-    def send(self, data: bytes) -> None:
+    def send(self, data: Union[bytes, memoryview]) -> None:
         """
         Send received data to the boiler with error handling.
         Rebroadcasts the UDP frame to act as the gateway.
@@ -113,6 +118,11 @@ class GatewayListenerSender(ListenerSender):
         """
         try:
             logging.debug('Binding gateway listener on port %d', self.udp_port)
+            rcvbuf = self.listen_manager.set_receive_buffer(RCVBUF_SIZE)
+            if rcvbuf < RCVBUF_MIN:
+                logging.warning('Gateway listener receive buffer is only %d bytes, '
+                                'consider raising it with: sysctl -w net.core.rmem_max=16777216',
+                                rcvbuf)
             # Use bind_with_delta with delta=0 since gateway listens on the actual port
             self.listen_manager.bind_with_delta(
                 port=self.udp_port,
@@ -125,7 +135,7 @@ class GatewayListenerSender(ListenerSender):
             logging.error('Failed to bind listener: %s', str(e))
             raise
 
-    def handle_data(self, data: bytes, addr: tuple):
+    def handle_data(self, data: Union[bytes, memoryview], addr: tuple):
         """Handle UDP data from the gateway.
 
         Publishes discovery information (HargaWebApp, SN) to the bootstrap channel.
@@ -135,10 +145,10 @@ class GatewayListenerSender(ListenerSender):
         _subpart: str = ''
         _str_parts: list[str] = []
 
+        # decode the datagram only once, it is used both for logging and parsing
+        _str = str(data, 'utf-8')
         logging.debug('handle_data::received %d bytes from %s:%d ==>%s',
-                      len(data), addr[0], addr[1], data.decode())
-
-        _str = data.decode()
+                      len(data), addr[0], addr[1], _str)
         _str_parts = _str.split('\r\n')
         for part in _str_parts:
             logging.log(15, 'UDP received: %s', part)
@@ -19,6 +19,7 @@ import logging
 import threading
 import sys
 import time
+from queue import Empty
 
 # Third party imports
 from myhargassner.pubsub.pubsub import PubSub
@@ -34,19 +35,6 @@ from myhargassner.mqtt_informer import ThreadedMqttInformer
 
 #----------------------------------------------------------#
 
-app_config = AppConfig()
-
-# Check for required password
-if not app_config.mqtt_password:
-    print("ERROR: MQTT password must be set in the configuration file or via command-line argument.")
-    sys.exit(1)
-
-# Set up logging using AppConfig
-app_config.setup_logging()
-logging.info('Started MyHargassner')
-
-#----------------------------------------------------------#
-
 #from queue import Queue,Empty
 
 class PubSubListener(threading.Thread):
@@ -69,15 +57,15 @@ class PubSubListener(threading.Thread):
     def run(self):
         """ Method called by start() method of the thread. """
 
-        logging.info("Run start, listen to messages with a pause of 100ms between each one...")
+        logging.info("Run start, listen to messages...")
 
         is_running = True
         counter = 0
         while is_running:
-            message = next(self.message_queue.listen())
+            # blocking get, the queue itself paces the listener
+            message = self.message_queue.get_message()
             logging.info("receives : id : %d : %s",
                   message['id'], message['data'])
-            time.sleep(0.1)
             is_running = message['data'] != "End"
             counter += 1
 
@@ -99,14 +87,13 @@ def wait_for_restart_trigger(pub: PubSub) -> str:
         while True:
             try:
                 # Wait for restart request message
-                iterator = system_queue.listen(timeout=1.0)
-                message = next(iterator)
+                message = system_queue.get_message(timeout=1.0)
 
                 if message and message['data'] == 'RESTART_REQUESTED':
                     logging.info("Restart request received via PubSub")
                     return "System_Restart_Request"
 
-            except StopIteration:
+            except Empty:
                 # No message received, continue waiting
                 continue
 
@@ -115,8 +102,31 @@ def wait_for_restart_trigger(pub: PubSub) -> str:
         pub.unsubscribe('system', system_queue)
 
 
+def _load_config() -> AppConfig:
+    """
+    Load the configuration, check the MQTT password and set up logging.
+
+    Returns:
+        AppConfig: The application configuration
+    """
+    # configuration and logging are set up here, not at import time
+    app_config = AppConfig()
+
+    # Check for required password
+    if not app_config.mqtt_password:
+        print("ERROR: MQTT password must be set in the configuration file or via command-line argument.")
+        sys.exit(1)
+
+    # Set up logging using AppConfig
+    app_config.setup_logging()
+    return app_config
+
+
 def main():
     """Main entry point with restart orchestration."""
+    app_config = _load_config()
+    logging.info('Started MyHargassner')
+
     restart_count = 0
 
     # optional PubSubListener for testing messages
@@ -8,7 +8,7 @@ import logging
 import threading
 import socket
 from queue import Empty
-from typing import Optional, Dict, Generic, TypeVar, Union
+from typing import Optional, Dict, Union
 
 # Third party imports
 from paho.mqtt.client import Client, MQTTMessage
@@ -50,6 +50,8 @@ class MqttActuator(ShutdownAware, ChanelReceiver, MqttBase):
 
         self._main_client: Optional[Client] = None
         self._boiler_config: Dict[str, dict] = {}
+        self._param_by_command_id: Dict[str, dict] = {}  # Select parameters by PRxxx command_id
+        self._param_by_key: Dict[str, dict] = {}  # Number parameters by str(key)
         self._client: Optional[TelnetClient] = None
         self.src_iface: bytes
         self._service_lock: threading.Lock
@@ -67,12 +69,13 @@ class MqttActuator(ShutdownAware, ChanelReceiver, MqttBase):
         self._service_lock = lock
         self._client = TelnetClient(self.src_iface, b'', buffer_size=self._appconfig.buff_size, port=4000)
 
-    def _parse_parameter_response(self, data: bytes) -> dict[str, dict]:
+    def _parse_parameter_response(self, data: Union[bytes, str]) -> dict[str, dict]:
         """Parse parameter responses from the boiler, including numeric and select types.
 
         Args:
             data: Raw response from the boiler, can contain multiple parameters
-                 separated by $ (each response starts with $)
+                 separated by $ (each response starts with $).
+                 bytes are decoded as latin1, str is parsed as is.
 
         Returns:
             dict[str, dict]:
@@ -81,7 +84,7 @@ class MqttActuator(ShutdownAware, ChanelReceiver, MqttBase):
         """
         result: dict[str, dict] = {}
         try:
-            text = data.decode('latin1')
+            text = data.decode('latin1') if isinstance(data, bytes) else data
             # Explanation:
             # text.split('$') splits the input string text at every $ character.
             # This produces a list of substrings, but the $ is removed from each part.
@@ -271,12 +274,16 @@ class MqttActuator(ShutdownAware, ChanelReceiver, MqttBase):
         # Extract the actual configuration data by removing the prefix if present
         if msg.startswith('BoilerConfig:'):
             msg = msg[len('BoilerConfig:'):]
-            # Convert string to bytes with latin1 encoding to match the parser's expectations
-            msg_bytes = msg.encode('latin1')
-            result = self._parse_parameter_response(msg_bytes)
+            # the message is already text, parse it without a latin1 round-trip
+            result = self._parse_parameter_response(msg)
             if result:
                 self._display_parameters_config(result)
                 self._boiler_config = result
+                # index the parameters by the ids used in MQTT callbacks and telnet responses
+                self._param_by_command_id = {info['command_id']: info for info in result.values()
+                                             if 'command_id' in info}
+                self._param_by_key = {str(info['key']): info for info in result.values()
+                                      if 'key' in info}
             else:
                 logging.warning("Failed to parse boiler configuration from message")
         else:
@@ -358,11 +365,7 @@ class MqttActuator(ShutdownAware, ChanelReceiver, MqttBase):
                 if not self._boiler_config:
                     logging.error("No boiler configuration available")
                     return
-                param_info = None
-                for info in self._boiler_config.values():
-                    if info.get('command_id') == param_id:
-                        param_info = info
-                        break
+                param_info = self._param_by_command_id.get(param_id)
                 if not param_info:
                     logging.error("Received callback for unknown parameter ID: %s", param_id)
                     return
@@ -482,11 +485,7 @@ class MqttActuator(ShutdownAware, ChanelReceiver, MqttBase):
                 if not self._boiler_config:
                     logging.error("No boiler configuration available")
                     return
-                param_info = None
-                for info in self._boiler_config.values():
-                    if str(info.get('key', '')) == param_id:
-                        param_info = info
-                        break
+                param_info = self._param_by_key.get(param_id)
                 if not param_info:
                     logging.error("Received callback for unknown parameter ID: %s", param_id)
                     return
@@ -674,23 +673,16 @@ class MqttActuator(ShutdownAware, ChanelReceiver, MqttBase):
                 try:
                     logging.debug('MqttActuator: waiting for messages')
                     #logging.debug('MQTT ChannelQueue size: %d', self._msq.qsize())
-                    # Use a non-blocking iterator with timeout for inter-component communication
-                    iterator = None
+                    # wait with timeout so shutdown requests are seen, raises Empty when nothing came
                     _message = None
                     if self._trk:
-                        iterator = self._trk.listen(timeout=self._appconfig.queue_timeout())
-                    try:
-                        if iterator:
-                            _message = next(iterator)
-                    except StopIteration:
-                        # No message received within the timeout
-                        continue
+                        _message = self._trk.get_message(timeout=self._appconfig.queue_timeout())
                     if not _message:
                         logging.debug('MqttActuator: received empty message')
                         continue
                     msg = _message['data']
                     logging.debug('MqttActuator: received message: %s', msg)
-                    self._handle_message(msg.encode('latin-1'))
+                    self._handle_message(msg)
                 except Empty:
                     logging.debug("MqttActuator: no message received")
                 except Exception as e: # pylint: disable=broad-except
@@ -718,18 +710,18 @@ class MqttActuator(ShutdownAware, ChanelReceiver, MqttBase):
                 except Exception as e:
                     logging.warning('Error closing telnet client: %s', e)
 
-    def _handle_message(self, buffer: bytes) -> None:
+    def _handle_message(self, buffer: str) -> None:
         """
         Handle incoming messages from the boiler.
 
         Args:
-            buffer (bytes): The incoming message to process
+            buffer (str): The incoming message to process, as published on the track channel
         """
         logging.debug("MqttActuator._handle_message called with buffer: %s", buffer)
 
-        while b'\r\n' in buffer:
-            line, buffer = buffer.split(b'\r\n', 1)
-            line_str = line.decode('latin1', errors='replace').strip()
+        # split the buffer once: the text after the last \r\n is an incomplete line
+        for line in buffer.split('\r\n')[:-1]:
+            line_str = line.strip()
             if not line_str:
                 continue
             param_id = None
@@ -742,16 +734,8 @@ class MqttActuator(ShutdownAware, ChanelReceiver, MqttBase):
                     logging.debug("Extracted param_id: %s", param_id)
                 else:
                     continue
-                param_info = None
-                for info in self._boiler_config.values():
-                    if info.get('command_id') == param_id:
-                        param_info = info
-                        logging.debug("match command_id type: %s", param_info.get('type'))
-                        break
-                    if str(info.get('key')) == param_id:
-                        param_info = info
-                        logging.debug("match key type: %s", param_info.get('type'))
-                        break
+                param_info = (self._param_by_command_id.get(param_id)
+                              or self._param_by_key.get(param_id))
                 if not param_info:
                     logging.error("Received message for unknown parameter ID: %s", param_id)
                     continue
@@ -907,64 +891,14 @@ class MqttActuator(ShutdownAware, ChanelReceiver, MqttBase):
             return result_float
         return result_str
 
-T = TypeVar("T", bound=MqttActuator)
-
-class Threaded(Generic[T]):
-    """
-    A generic class that runs an entity in a separate thread.
-
-    Args:
-        entity (T): The entity instance to be run in a thread. The entity must implement a `service()` method.
-
-    Attributes:
-        _entity (T): The entity being threaded.
-        _thread (Thread): The thread running the entity's service method.
+class ThreadedMqttActuator(threading.Thread):
     """
-    def __init__(self, entity: T) -> None:
-        """
-        Initialize the Threaded wrapper with an entity to run in a thread.
-
-        Args:
-            entity (T): The entity instance to be threaded.
-                        Must implement a service() method.
+    Threaded wrapper for MqttActuator, running its service() in a separate thread.
 
-        Note:
-            Creates a thread named "Thread-{EntityClassName}" but does not start it.
-            The thread will execute the entity's service method when started.
-        """
-        logging.debug("Threaded<%s> instantiated", type(entity).__name__)
-        logging.debug("Threaded.__init__ called")
-        self._entity = entity
-        thread_name = f"Thread-{type(entity).__name__}"
-        self._thread = threading.Thread(target=self._entity.service, name=thread_name)
-
-    def start(self) -> None:
-        """
-        Start the entity's service in a separate thread.
-
-        This method starts the thread created in __init__, which runs
-        the entity's service method. The thread runs independently of
-        the calling thread.
-
-        Note:
-            This is a non-blocking call. The thread continues to run
-            after this method returns.
-        """
-        logging.debug("Threaded.start called")
-        self._thread.start()
-
-
-
-class ThreadedMqttActuator(Threaded[MqttActuator]):
-    """
-    A Threaded wrapper for MqttActuator, allowing it to run in a separate thread.
-
-    Args:
-        device (DeviceInfo): The device information used to initialize the MqttActuator.
+    The thread is a daemon, so a stuck actuator never blocks process exit.
 
     Example:
-        >>> device_info = DeviceInfo(...)
-        >>> threaded_actuator = ThreadedMqttActuator(device_info)
+        >>> threaded_actuator = ThreadedMqttActuator(appconfig, communicator, device_info, src_iface, lock)
         >>> threaded_actuator.start()
     """
     def __init__(self, appconfig: AppConfig, communicator: PubSub, device_info: DeviceInfo, src_iface: bytes, lock: threading.Lock) -> None: # pylint: disable=line-too-long
@@ -972,17 +906,20 @@ class ThreadedMqttActuator(Threaded[MqttActuator]):
         Initialize a threaded MQTT actuator for the device.
 
         Args:
+            appconfig (AppConfig): Application configuration
             communicator (PubSub): The publish/subscribe communication system
             device_info (DeviceInfo): Information about the device to control
+            src_iface (bytes): Interface used to reach the boiler
+            lock (threading.Lock): Lock shared with the telnet service
 
-        This class combines the MqttActuator with the Threaded wrapper to allow
-        the actuator to run in its own thread. The actuator is created but not
-        started - use the start() method to begin operation.
+        The actuator is created but not started - use the start() method to begin operation.
         """
-        logging.debug("ThreadedMqttActuator instantiated")
-        logging.debug("ThreadedMqttActuator.__init__ called")
-        entity = MqttActuator(appconfig, communicator, device_info, src_iface, lock)
-        super().__init__(entity)
+        super().__init__(name='Thread-MqttActuator', daemon=True)
+        self._entity = MqttActuator(appconfig, communicator, device_info, src_iface, lock)
+
+    def run(self) -> None:
+        """Run the MqttActuator service in a separate thread."""
+        self._entity.service()
 
     def request_shutdown(self) -> None:
         """Request graceful shutdown of the MQTT actuator thread."""
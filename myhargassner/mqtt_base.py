@@ -39,7 +39,10 @@ class MqttBase():
     def attach_paho_logger(sensor):
         """
         Attach a logger to the Paho MQTT client for debugging.
+        Nothing is attached unless DEBUG is enabled: paho calls on_log for every packet.
         """
+        if not logging.getLogger().isEnabledFor(logging.DEBUG):
+            return
         client = getattr(sensor, 'mqtt_client', None)
         if client is not None:
             def on_log(client, userdata, level, buf): # pylint: disable=unused-argument
@@ -67,12 +70,10 @@ class MqttBase():
         Args:
             _name (str): The name to use for the device.
         """
-        lstr = []
-        lstr.append(_name)
         self._device_info = DeviceInfo(
                             name=_name,
                             manufacturer="Hargassner",
-                            identifiers=lstr)
+                            identifiers=[_name])
     def device_info(self) -> DeviceInfo:
         """
         Get the device information.
@@ -4,61 +4,41 @@ Module for MQTT client to handle to boiler
 
 # Standard library imports
 import logging
+import sys
 import threading
 import traceback
 from queue import Empty
 from typing import Union, Optional
 
 # Third party imports
-from ha_mqtt_discoverable import Settings, DeviceInfo # type: ignore
+import paho.mqtt.client as mqtt
+from paho.mqtt.enums import CallbackAPIVersion
+from ha_mqtt_discoverable import Settings # type: ignore
 from ha_mqtt_discoverable.sensors import Sensor, SensorInfo # type: ignore
 
 from myhargassner.pubsub.pubsub import PubSub, ChanelQueue, ChanelPriorityQueue
 
 # Project imports
 from myhargassner.appconfig import AppConfig
-from myhargassner import hargconfig
 from myhargassner.mqtt_base import MqttBase
 from myhargassner.core import ShutdownAware
 
-class MySensor(Sensor):
-    """
-    Custom sensor class extending ha_mqtt_discoverable Sensor.
-    
-    Handles the creation and configuration of MQTT sensors with optional unit of measurement
-    and description attributes.
-    """
-    def __init__(self, _name: str, _id: str, _dict: dict, _config: hargconfig.HargConfig,
-                 _device_info: DeviceInfo, _mqtt: Settings.MQTT):
-        """
-        Initialize a new sensor.
+# maximum number of pending keys on the info channel. A new value of a key replaces
+# the pending one, so this only bounds the number of distinct keys waiting: the oldest
+# is dropped, with a warning, if the broker stalls while that many keys are pending
+INFO_QUEUE_MAXLEN = 1024
 
-        Args:
-            _name: Display name of the sensor
-            _id: Unique identifier for the sensor
-            _dict: Dictionary containing sensor values
-            _config: Configuration object containing sensor metadata
-            _device_info: Device information for MQTT discovery
-            _mqtt: MQTT connection settings
-        """
-        if _id in _dict:
-            _state = _dict[_id]
-        else:
-            _state = ""
-        if _id in _config.wanted:
-            _info = SensorInfo(name=_name,
-                             unique_id=_id+"/"+_dict["BL_ADDR"],
-                             unit_of_measurement=_config.desc[_id]['unit'],
-                             device=_device_info)
-        else:
-            _info = SensorInfo(name=_name,
-                             unique_id=_id+"/"+_dict["BL_ADDR"],
-                             device=_device_info)
-        _settings = Settings(mqtt=_mqtt, entity=_info)
-        super().__init__(_settings)
-        self.set_state(_state)
-        if _id in _config.desc:
-            self.set_attributes({'description': _config.desc[_id]['desc']})
+# marks a key not yet in _dict, never equal to a received value
+_MISSING = object()
+
+# put in the info queue by request_shutdown() to wake up the blocked informer
+_WAKEUP = {'data': None, 'id': -1}
+
+def _info_key(data: Optional[str]) -> Optional[str]:
+    """Return the key of an info channel message, None for the _WAKEUP message."""
+    if data is None:
+        return None
+    return data.partition('££')[0]
 
 class MqttInformer(ShutdownAware, MqttBase):
     """
@@ -78,6 +58,9 @@ class MqttInformer(ShutdownAware, MqttBase):
     _key: Sensor # login key.
     _kt: Sensor # Model of Boiler.
     _msg: Sensor # base sensor to display messages.
+    _unique_suffix: str # "/" + BL_ADDR appended to each sensor unique_id.
+    _client: Optional[mqtt.Client] # paho client shared by all the sensors.
+    _sensor_mqtt: Settings.MQTT # mqtt settings of the sensors, with the shared client.
 
     def __init__(self, appconfig: AppConfig, communicator: PubSub):
         """ Constructor of the MqttInformer class """
@@ -91,146 +74,227 @@ class MqttInformer(ShutdownAware, MqttBase):
         self._msq: Optional[Union[ChanelPriorityQueue,ChanelQueue]] = None # Message queue for receiving messages
         self._dict = {}
         self._sensors= {}
+        self._unique_suffix = ""
+        self._client = None
+        self._sensor_mqtt = self.mqtt_settings
+
+    def request_shutdown(self) -> None:
+        """
+        Request graceful shutdown of the informer.
+        The informer waits on its queue without timeout, so it is woken up
+        with a message carrying no data.
+        """
+        ShutdownAware.request_shutdown(self)
+        _msq = self._msq
+        if _msq is not None:
+            _msq.put(_WAKEUP)
 
     def _init_sensors(self):
-        """This method init the basis sensors"""
-        if 'HargaWebApp' in self._dict:
-            logging.debug('HargaWebApp in dict --> set')
-            self._web_app.set_state(self._dict['HargaWebApp'])
+        """
+        This method init the basis sensors.
+        _create_sensor() already published the values received so far, only MSG
+        was overwritten by the start message.
+        """
         if 'MSG' in self._dict:
             logging.debug('MSG in dict --> set')
             self._msg.set_state(self._dict['MSG'])
-        if 'TOKEN' in self._dict:
-            logging.debug('TOKEN in dict --> set')
-            self._token.set_state(self._dict['TOKEN'])
-        if 'KEY' in self._dict:
-            logging.debug('KEY in dict --> set')
-            self._key.set_state(self._dict['KEY'])
+
+    def _connect_client(self) -> None:
+        """
+        Connect the paho client shared by all the sensors.
+
+        Without it each sensor opens its own connection and network thread, so a
+        batch of updates is written on as many sockets. With one client, the
+        publishes of a batch are queued on one connection and flushed together
+        by its network loop.
+        """
+        # no client_id: the broker assigns a unique one, so an informer still stopping
+        # during a restart, or another gateway instance, is not disconnected by this one
+        self._client = mqtt.Client(callback_api_version=CallbackAPIVersion.VERSION2)
+        self._client.username_pw_set(self.mqtt_settings.username,
+                                     password=self.mqtt_settings.password)
+        self._client.connect(self.mqtt_settings.host, self.mqtt_settings.port)
+        self._client.loop_start()
+        self._sensor_mqtt = Settings.MQTT(host=self.mqtt_settings.host,
+                                          port=self.mqtt_settings.port,
+                                          username=self.mqtt_settings.username,
+                                          password=self.mqtt_settings.password,
+                                          client=self._client)
+
+    def _disconnect_client(self) -> None:
+        """Stop and disconnect the shared paho client, if connected."""
+        if self._client is not None:
+            self._client.loop_stop()
+            self._client.disconnect()
+            self._client = None
+            self._sensor_mqtt = self.mqtt_settings
 
     def _create_sensor(self, _name: str, _id: str) -> Sensor:
-        if _id in self._dict:
-            _state= self._dict[_id]
-        else:
-            _state= ""
-        if _id in self.config.wanted and _id in self.config.desc:
-            _info= SensorInfo(name= _name,
-                              unique_id= _id+"/"+self._dict["BL_ADDR"],
-                              unit_of_measurement= self.config.desc[_id]['unit'],
-                              device=self._device_info)
-        else:
-            _info= SensorInfo(name= _name,
-                              unique_id= _id+"/"+self._dict["BL_ADDR"],
-                              device=self._device_info)
-        _settings= Settings(mqtt=self.mqtt_settings, entity= _info)
+        """
+        Create a sensor for the boiler device.
+
+        The unit and description come from the config when the value is described there.
+
+        Args:
+            _name: Display name of the sensor
+            _id: Identifier of the value, used for the unique_id
+
+        Returns:
+            Sensor: The sensor, with its state set from the values already received
+        """
+        _desc = self.config.desc.get(_id)
+        _info_kwargs = {'name': _name,
+                        'unique_id': _id + self._unique_suffix,
+                        'device': self._device_info}
+        if _desc is not None:
+            _info_kwargs['unit_of_measurement'] = _desc['unit']
+        _settings= Settings(mqtt=self._sensor_mqtt, entity=SensorInfo(**_info_kwargs))
         _sensor= Sensor(_settings)
-        _sensor.set_state(_state)
-        if _id in self.config.wanted and _id in self.config.desc:
-            _sensor.set_attributes({'description': self.config.desc[_id]['desc']})
+        _sensor.set_state(self._dict.get(_id, ""))
+        if _desc is not None:
+            _sensor.set_attributes({'description': _desc['desc']})
         return _sensor
 
-
     def _create_all_sensors(self):
+        # unique_id suffix shared by all the sensors of the boiler
+        self._unique_suffix = "/" + self._dict["BL_ADDR"]
+        self._connect_client()
         # create basis mandatory sensors
-        self._msg = MySensor("Message","MSG",
-                                 self._dict, self.config, self._device_info, self.mqtt_settings)
+        self._msg = self._create_sensor("Message", "MSG")
         self._msg.set_state("Started MyHargassner")
-        self._web_app = MySensor("HargaWebApp","HargaWebApp",
-                                 self._dict, self.config, self._device_info, self.mqtt_settings)
-        # we attach a paho logger to get paho-mqtt debug messages
+        self._web_app = self._create_sensor("HargaWebApp", "HargaWebApp")
+        # all the sensors share one client: we attach a paho logger once to get paho-mqtt debug messages
         self.attach_paho_logger(self._web_app)
-
-        self._token = MySensor("Login Token", "TOKEN", self._dict, self.config, self._device_info, self.mqtt_settings)
-        self.attach_paho_logger(self._token)
-        self._key = MySensor("Login Key", "KEY", self._dict, self.config, self._device_info, self.mqtt_settings)
-        self.attach_paho_logger(self._key)
+        self._token = self._create_sensor("Login Token", "TOKEN")
+        self._key = self._create_sensor("Login Key", "KEY")
         # sensors coming in normal mode
         self._kt = self._create_sensor("KT","KT")
-        self.attach_paho_logger(self._kt)
-        # sensors wanted from the pm buffer
+        # sensors wanted from the pm buffer, the basis ones are already created with the same unique_id
+        _desc = self.config.desc
+        _basis = {'MSG': self._msg, 'HargaWebApp': self._web_app,
+                  'TOKEN': self._token, 'KEY': self._key, 'KT': self._kt}
         for _part in self.config.wanted:
-            if _part not in self.config.desc:
+            if _part not in _desc:
                 logging.warning("Missing description for %s in config", _part)
-                continue
-            _sensor= self._create_sensor(self.config.desc[_part]['name'],_part)
-            _sensor.set_state("")
-            self.attach_paho_logger(_sensor)
-            self._sensors[_part]= _sensor
+        # the sensors dict is filled in one update, start() holds a reference to it
+        self._sensors.update(_basis)
+        self._sensors.update({_part: self._create_sensor(_desc[_part]['name'], _part)
+                              for _part in self.config.wanted
+                              if _part in _desc and _part not in _basis})
 
+    def _drain(self, max_batch: int = 128) -> dict:
+        """
+        Wait for one message on the info channel, then drain the messages already queued.
+
+        Only the last value received for a key is kept, so a burst of updates
+        results in a single state change per sensor.
+
+        Args:
+            max_batch: Maximum number of messages handled in one batch
+
+        Returns:
+            dict: key -> last value received in the batch, empty if the wait timed out
+        """
+        _batch: dict = {}
+        if not self._msq:
+            return _batch
+        # block until one message arrives, then take the rest without waiting.
+        # No timeout: request_shutdown() wakes us up with a _WAKEUP message
+        try:
+            _first = self._msq.get_message()
+        except Empty:
+            return _batch
+        _messages = [_first]
+        try:
+            while len(_messages) < max_batch:
+                _messages.append(self._msq.get_message(block=False))
+        except Empty:
+            pass
+        _debug = logging.getLogger().isEnabledFor(logging.DEBUG)
+        for _message in _messages:
+            msg = _message['data']
+            if msg is None:
+                # _WAKEUP message, nothing to parse
+                continue
+            if _debug:
+                logging.debug('MqttInformer: received %s', msg)
+            # partition splits once and does not build a list
+            _key, _sep, _value = msg.partition('££')
+            if not _sep:
+                logging.warning('MqttInformer: invalid message format %s', msg)
+                continue
+            # keys come from a small fixed vocabulary, interned keys let the
+            # _dict and _sensors lookups match on identity
+            _batch[sys.intern(_key)] = _value
+        return _batch
 
     def start(self) -> None:
         """This method runs the MqttInformer, waiting for message on _info_queue"""
         _stage: str = ''
 
-        self._msq = self._com.subscribe(self._channel, self.name())
+        self._msq = self._com.subscribe(self._channel, self.name(),
+                                        maxlen=INFO_QUEUE_MAXLEN, key=_info_key)
+        # loop invariants, bound once instead of looked up for every message.
+        # Both dicts are only replaced when the loop exits on error.
+        sensors = self._sensors
+        values = self._dict
 
         while self._msq and not self._shutdown_requested:
+            # the level is checked once per batch, not for every message
+            _debug = logging.getLogger().isEnabledFor(logging.DEBUG)
             try:
-                logging.debug('MqttInformer: waiting for messages')
-                #logging.debug('MQTT ChannelQueue size: %d', self._msq.qsize())
-                # Use a non-blocking iterator with timeout for inter-component communication
-                iterator = self._msq.listen(timeout=self._appconfig.queue_timeout())
-                try:
-                    _message = next(iterator)
-                except StopIteration:
-                    logging.debug('StopIteration: No message received, continuing...')
-                    continue
-                if not _message:
-                    logging.debug('MqttInfomer no message received')
+                if _debug:
+                    logging.debug('MqttInformer: waiting for messages')
+                _batch = self._drain()
+                if not _batch:
+                    if _debug:
+                        logging.debug('MqttInfomer no message received')
                     continue
-                msg = _message['data']
-                logging.debug('MqttInformer: received %s', msg)
-                _str_parts = msg.split('££')
-                if not _str_parts or len(_str_parts) < 2:
-                    logging.warning('MqttInformer: invalid message format %s', msg)
-                    continue
-                if _stage == 'device_info_ok':
-                    # we are in normal mode, we handle new or modified values
-                    logging.debug('normal mode analyse message')
-                    # we test either the value is changed or it is new
-                    if ((_str_parts[0] in self._dict) and (_str_parts[1] != self._dict[_str_parts[0]])) or (not _str_parts[0] in self._dict): # pylint: disable=line-too-long
-                        logging.debug('adding new value:[%s/%s]', _str_parts[0], _str_parts[1])
-                        self._dict[_str_parts[0]] = _str_parts[1]
-                        if _str_parts[0] == 'HargaWebApp':
-                            self._web_app.set_state(_str_parts[1])
-                        if _str_parts[0] == 'KT':
-                            self._kt.set_state(_str_parts[1])
-                        # treat sensors from telnet pm buffer
-                        if _str_parts[0] in self.config.wanted and _str_parts[0] in self._sensors:
-                            logging.debug('updating state of sensor:%s',_str_parts[0])
-                            self._sensors[_str_parts[0]].set_state(_str_parts[1])
-                    else:
-                        logging.debug('ignored [%s/%s]', _str_parts[0], _str_parts[1])
-                else:
-                    # device_info is not yes init
-                    logging.debug("device_info not ready")
-                    self._dict[_str_parts[0]] = _str_parts[1]
-                    logging.log(15, 'adding new value [%s:%s] to dict', _str_parts[0], _str_parts[1])
-                    if 'BL_ADDR' in self._dict:
-                        logging.debug("BL_ADDR:%s",self._dict["BL_ADDR"])
+                for _key, _value in _batch.items():
+                    if _stage == 'device_info_ok':
+                        # we are in normal mode, we handle new or modified values
+                        # we test either the value is changed or it is new
+                        if values.get(_key, _MISSING) != _value:
+                            if _debug:
+                                logging.debug('adding new value:[%s/%s]', _key, _value)
+                            values[_key] = _value
+                            _sensor = sensors.get(_key)
+                            if _sensor is not None:
+                                if _debug:
+                                    logging.debug('updating state of sensor:%s', _key)
+                                _sensor.set_state(_value)
+                        elif _debug:
+                            logging.debug('ignored [%s/%s]', _key, _value)
                     else:
-                        logging.debug("BL_ADDR missing")
-                    # temporary version: we use only BL_ADDR to init device_info
-                    # todo enrich the device_info with info from telnet dialog
-                    # and implement a way to inform MqttActuator in a differed way
-                    if 'BL_ADDR' in self._dict:
-                        # we have all the info to init device_info
-                        logging.info('Boiler device_info is complete')
-                        # Define the device. At least one of `identifiers` or `connections` must be supplied
-                        self.init_device_info(self._dict["BL_ADDR"])
-                        logging.debug("Device Info initialized")
-                        self._create_all_sensors()
-                        _stage = 'device_info_ok'
-                        # now we init the already available sensors
-                        self._init_sensors()
+                        # device_info is not yes init
+                        self._dict[_key] = _value
+                        logging.log(15, 'adding new value [%s:%s] to dict', _key, _value)
+                        if _debug:
+                            logging.debug("device_info not ready, BL_ADDR:%s",
+                                          self._dict.get("BL_ADDR", "missing"))
+                        # temporary version: we use only BL_ADDR to init device_info
+                        # todo enrich the device_info with info from telnet dialog
+                        # and implement a way to inform MqttActuator in a differed way
+                        if 'BL_ADDR' in self._dict:
+                            # we have all the info to init device_info
+                            logging.info('Boiler device_info is complete')
+                            # Define the device. At least one of `identifiers` or `connections` must be supplied
+                            self.init_device_info(self._dict["BL_ADDR"])
+                            logging.debug("Device Info initialized")
+                            self._create_all_sensors()
+                            _stage = 'device_info_ok'
+                            # now we init the already available sensors
+                            self._init_sensors()
             except Empty:
-                logging.debug("MqttInformer: no message received")
-                logging.debug('MqttInformer stage is now %s', _stage)
+                if _debug:
+                    logging.debug("MqttInformer: no message received, stage is %s", _stage)
             except Exception as e: # pylint: disable=broad-except
                 logging.critical("MqttInformer: error %s", e)
                 logging.critical(traceback.format_exc())
                 _stage = ''
                 self._dict = {}
                 self._sensors = {}
+                self._disconnect_client()
                 # whenever we exit the loop, we unsubscribe from the channel
                 self._com.unsubscribe(self._channel, self._msq)
                 self._msq = None
@@ -241,6 +305,7 @@ class MqttInformer(ShutdownAware, MqttBase):
         if self._msq:
             self._com.unsubscribe(self._channel, self._msq)
             self._msq = None
+        self._disconnect_client()
 
 
 class ThreadedMqttInformer(threading.Thread):
@@ -98,8 +98,10 @@ SOFTWARE.
 """
 
 import warnings
-from threading import Lock
-from queue import Queue, PriorityQueue, Empty
+from collections import deque
+from threading import Lock, Event
+from time import monotonic
+from queue import PriorityQueue, Empty
 
 
 class PubSubBase():
@@ -144,11 +146,15 @@ class PubSubBase():
 
         self.channels = {}
         self.count = {}
+        # channel -> its ChanelQueue when it has exactly one subscriber,
+        # used by publish_() to skip the fan-out loop
+        self.single_queue = {}
 
         self.channels_lock = Lock()
         self.count_lock = Lock()
 
-    def subscribe_(self, channel, is_priority_queue, subscriber=None):
+    def subscribe_(self, channel, is_priority_queue, subscriber=None, maxlen=None,
+                   key=None):
         """
         Return a synchronised FIFO queue object used by a subscriber
         to listen at messages sent by publishers on a given channel.
@@ -160,10 +166,21 @@ class PubSubBase():
         - is_priority_queue : True if FIFO queue give message according
                             their priority else FIFO queue without
                             priority.
+        - maxlen : None for an unbounded queue, else the maximum number of
+                   messages kept in the queue : when it is full, the oldest
+                   message is dropped to make room for the new one.
+                   Only for queues without priority.
+        - key : None, or a function returning the key of a message data :
+                a new message replaces the pending one with the same key.
+                Only for queues without priority.
         """
 
         if not channel:
             raise ValueError('channel : None value not allowed')
+        if maxlen is not None and (is_priority_queue or maxlen <= 0):
+            raise ValueError('maxlen : must be > 0 and without priority')
+        if key is not None and is_priority_queue:
+            raise ValueError('key : only for queues without priority')
 
         if channel not in self.channels:
             self.channels_lock.acquire()
@@ -176,14 +193,28 @@ class PubSubBase():
         if is_priority_queue:
             message_queue = ChanelPriorityQueue(self, channel)
         else:
-            message_queue = ChanelQueue(self, channel)
+            message_queue = ChanelQueue(self, channel, maxlen, key)
         self.channels[channel].append(message_queue)
 
         if subscriber:
             message_queue.subscriber = subscriber
+        self.update_single_queue(channel)
 
         return message_queue
 
+    def update_single_queue(self, channel):
+        """
+        Cache the queue of a channel if it is the only subscriber and
+        a FIFO queue without priority, else remove the channel from the cache.
+        Called each time a subscriber comes or goes.
+        """
+        channel_queues = self.channels.get(channel, [])
+        if (len(channel_queues) == 1 and
+                isinstance(channel_queues[0], ChanelQueue)):
+            self.single_queue[channel] = channel_queues[0]
+        else:
+            self.single_queue.pop(channel, None)
+
     def unsubscribe(self, channel, message_queue):
         """
         Used by a subscriber who doesn't want to receive messages
@@ -196,6 +227,7 @@ class PubSubBase():
             raise ValueError('message_queue : None value not allowed')
         if channel in self.channels:
             self.channels[channel].remove(message_queue)
+            self.update_single_queue(channel)
 
     def publish_(self, channel, message, is_priority_queue, priority):
         """
@@ -252,10 +284,20 @@ class PubSubBase():
         # ID of current message
         _id = self.count[channel]
 
+        # Fast path : only one subscriber in channel, no overflow
+        single_queue = self.single_queue.get(channel)
+        if single_queue is not None and (
+                single_queue.maxlen is not None or
+                single_queue.qsize() < self.max_queue_in_a_channel):
+            single_queue.put({'data': message, 'id': _id})
+            return
+
         # Push message to all subscribers in channel
         for channel_queue in self.channels[channel]:
-            # Check if queue overflowed
-            if channel_queue.qsize() >= self.max_queue_in_a_channel:
+            # Check if queue overflowed, bounded queues drop their oldest
+            # message instead
+            if (channel_queue.maxlen is None and
+                    channel_queue.qsize() >= self.max_queue_in_a_channel):
                 warnings.warn((
                     f"Queue overflow for channel {channel}, "
                     f"> {self.max_queue_in_a_channel} "
@@ -277,22 +319,134 @@ class PubSubBase():
                                       block=False)
 
 
-class ChanelQueue(Queue):
+class ChanelQueue():
     """
     A FIFO queue for a channel.
+
+    Messages are kept in a deque : append() and popleft() are atomic
+    in CPython, so publishers never contend on a lock to put a message.
+    An Event wakes up the subscriber waiting in get().
+    When maxlen is None, the queue is unbounded and overflow is handled
+    by the publisher (see PubSubBase.publish_()), else the oldest message
+    is dropped when a message is put in a full queue, with a warning
+    issued at most every drop_warning_interval seconds.
+
+    When key is given, it is called with the data of each message put :
+    a message replaces the pending message with the same key, at its
+    place in the queue, so only the latest value of a key is delivered.
+    The deque then holds the pending keys, and a lock keeps it consistent
+    with the dictionary of the pending messages.
     """
 
-    def __init__(self, parent, channel):
+    # minimum delay in seconds between two warnings about dropped messages
+    drop_warning_interval = 60.0
+
+    def __init__(self, parent, channel, maxlen=None, key=None):
         """
         Create a new queue for the channel
         Parameters :
         - parent : communicator parent
         - channel : string for the name of the channel
+        - maxlen : None or maximum number of messages kept in the queue
+        - key : None or function returning the key of a message data
         """
-        super().__init__()
         self.parent = parent
         self.name = channel
         self.subscriber = ""
+        self.maxlen = maxlen
+        self.key = key
+        # the pending keys of a keyed queue are bounded in put()
+        self._buf = deque(maxlen=maxlen if key is None else None)
+        self._not_empty = Event()
+        self._dropped = 0
+        self._last_drop_warning = None
+        if key is None:
+            self._pop = self._buf.popleft
+        else:
+            self._pending = {}
+            self._lock = Lock()
+            self._pop = self._pop_pending
+
+    def qsize(self):
+        """ Return the number of messages in the queue """
+        return len(self._buf)
+
+    def empty(self):
+        """ Return True if there is no message in the queue """
+        return not self._buf
+
+    def put(self, item, block=True, timeout=None):
+        """
+        Put a message in the queue, never blocks.
+        block and timeout are accepted for queue.Queue compatibility.
+        """
+        # pylint: disable=unused-argument
+        dropped = False
+        if self.key is None:
+            # a full deque drops its oldest message itself in append()
+            dropped = (self.maxlen is not None and
+                       len(self._buf) >= self.maxlen)
+            self._buf.append(item)
+        else:
+            item_key = self.key(item['data'])
+            with self._lock:
+                if item_key not in self._pending:
+                    if (self.maxlen is not None and
+                            len(self._buf) >= self.maxlen):
+                        del self._pending[self._buf.popleft()]
+                        dropped = True
+                    self._buf.append(item_key)
+                self._pending[item_key] = item
+        self._not_empty.set()
+        if dropped:
+            self._warn_dropped()
+
+    def _pop_pending(self):
+        """ Remove and return the oldest pending message of a keyed queue """
+        with self._lock:
+            return self._pending.pop(self._buf.popleft())
+
+    def _warn_dropped(self):
+        """
+        Count a message dropped because the queue is full and warn,
+        at most every drop_warning_interval seconds.
+        """
+        self._dropped += 1
+        now = monotonic()
+        if (self._last_drop_warning is None or
+                now - self._last_drop_warning >= self.drop_warning_interval):
+            warnings.warn((f"Queue full for channel {self.name} "
+                           f"(maxlen={self.maxlen}), "
+                           f"{self._dropped} oldest message(s) dropped "
+                           f"for subscriber {self.subscriber}"))
+            self._dropped = 0
+            self._last_drop_warning = now
+
+    def get(self, block=True, timeout=None):
+        """
+        Remove and return a message from the queue.
+        Same behaviour as queue.Queue.get() : raise queue.Empty if no
+        message is available (immediately if block is False, else after
+        timeout seconds, never if timeout is None).
+        """
+        if not block:
+            timeout = 0
+        deadline = None if timeout is None else monotonic() + timeout
+        while True:
+            try:
+                return self._pop()
+            except IndexError:
+                pass
+            # clear before checking again, so a put() done meanwhile
+            # sets the event and the wait() below returns at once
+            self._not_empty.clear()
+            if self._buf:
+                continue
+            remaining = None if deadline is None else deadline - monotonic()
+            if remaining is not None and remaining <= 0:
+                raise Empty
+            if not self._not_empty.wait(remaining) and not self._buf:
+                raise Empty
 
     def listen(self, block=True, timeout=None):
         """
@@ -330,6 +484,19 @@ class ChanelQueue(Queue):
             except Empty:
                 return
 
+    def get_message(self, block=True, timeout=None):
+        """
+        Called by a subscriber to get a single message from the channel
+        without building a listen() iterator.
+
+        Returns the same dictionary as listen() yields.
+        Raises queue.Empty if no message is available before timeout
+        (or immediately if block is False).
+
+        Parameters : see listen() method
+        """
+        return self.get(block=block, timeout=timeout)
+
     def unsubscribe(self):
         """
         Used by a subscriber who doesn't want to receive messages
@@ -350,6 +517,7 @@ class ChanelPriorityQueue(PriorityQueue):
         super().__init__()
         self.parent = parent
         self.name = channel
+        self.maxlen = None
 
     def listen(self, block=True, timeout=None):
         """
@@ -367,6 +535,12 @@ class ChanelPriorityQueue(PriorityQueue):
             except Empty:
                 return
 
+    def get_message(self, block=True, timeout=None):
+        """
+        See : ChanelQueue.get_message() method
+        """
+        return self.get(block=block, timeout=timeout)[1]
+
     def unsubscribe(self):
         """
         Used by a subscriber who doesn't want to receive messages
@@ -389,7 +563,7 @@ class PubSub(PubSubBase):
     implementation and was designed thread-safe by Zhen Wang.
     """
 
-    def subscribe(self, channel, subscriber=None):
+    def subscribe(self, channel, subscriber=None, maxlen=None, key=None):
         """
         Return a synchronised normal FIFO queue object
         used by a subscriber to listen at messages sent
@@ -399,8 +573,12 @@ class PubSub(PubSubBase):
         See  PubSubBase.subscribe() for more details
         Parameter:
         - channel : the channel to listen to.
+        - maxlen : None or maximum number of messages kept,
+                   the oldest is dropped when the queue is full.
+        - key : None or function returning the key of a message data,
+                only the latest pending message of a key is kept.
         """
-        return self.subscribe_(channel, False, subscriber)
+        return self.subscribe_(channel, False, subscriber, maxlen, key)
 
     def publish(self, channel, message):
         """
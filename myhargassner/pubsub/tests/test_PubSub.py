@@ -37,6 +37,10 @@ SOFTWARE.
 ==============================================================================
 """
 
+import threading
+import warnings
+from queue import Empty
+
 import pytest
 
 from pubsub import PubSub, PubSubPriority
@@ -152,6 +156,37 @@ def test_no_message_on_channel(class_2_test):
     assert not msgs
 
 
+@pytest.mark.parametrize("class_2_test", [PubSub, PubSubPriority])
+def test_get_message(class_2_test):
+    """ Test getting messages one by one without listen() """
+
+    communicator = class_2_test()
+    message_queue = communicator.subscribe('test')
+    communicator.publish('test', 'hello world 1')
+    communicator.publish('test', 'hello world 2')
+
+    assert message_queue.get_message(timeout=1) == {'data': 'hello world 1', 'id': 0}
+    assert message_queue.get_message(block=False)['data'] == 'hello world 2'
+    # Queue is now empty
+    with pytest.raises(Empty):
+        message_queue.get_message(block=False)
+    with pytest.raises(Empty):
+        message_queue.get_message(timeout=0.01)
+
+
+@pytest.mark.parametrize("class_2_test", [PubSub, PubSubPriority])
+def test_get_message_wakeup(class_2_test):
+    """ Test a blocked subscriber is woken up by a publisher thread """
+
+    communicator = class_2_test()
+    message_queue = communicator.subscribe('test')
+    publisher = threading.Timer(0.05, communicator.publish, ('test', 'late message'))
+    publisher.start()
+
+    assert message_queue.get_message(timeout=5)['data'] == 'late message'
+    publisher.join()
+
+
 @pytest.mark.parametrize("class_2_test", [PubSub, PubSubPriority])
 def test_2_subscribers(class_2_test):
     """ Test 2 subscribers on 1 channel """
@@ -304,6 +339,116 @@ def test_channel_overflow(class_2_test):
     assert msgs[0]['data'] == 'hello world 4'
 
 
+def test_single_subscriber_fast_path():
+    """ Test the single subscriber cache follows subscribe and unsubscribe """
+
+    communicator = PubSub()
+    queue_1 = communicator.subscribe('test')
+    assert communicator.single_queue['test'] is queue_1
+    queue_2 = communicator.subscribe('test')
+    assert 'test' not in communicator.single_queue
+    communicator.publish('test', 'hello world 1')
+    queue_1.unsubscribe()
+    assert communicator.single_queue['test'] is queue_2
+    communicator.publish('test', 'hello world 2')
+
+    assert [message['data'] for message in queue_1.listen(block=False)] == \
+        ['hello world 1']
+    assert [message['data'] for message in queue_2.listen(block=False)] == \
+        ['hello world 1', 'hello world 2']
+    assert not PubSubPriority().single_queue
+
+
+def test_bounded_queue_drops_oldest():
+    """
+    Test a bounded queue keeps the newest messages and warns once
+    per drop_warning_interval about the dropped ones
+    """
+
+    communicator = PubSub(max_queue_in_a_channel=2)
+    message_queue = communicator.subscribe('test', maxlen=3)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        for i in range(5):
+            communicator.publish('test', f'hello world {i}')
+
+    msgs = [message['data'] for message in message_queue.listen(block=False)]
+    assert msgs == ['hello world 2', 'hello world 3', 'hello world 4']
+    assert len(caught) == 1
+    assert "1 oldest message(s) dropped" in str(caught[0].message)
+
+
+def test_bounded_queue_warning_counts_drops():
+    """ Test the drop warning reports the messages dropped since the last one """
+
+    communicator = PubSub()
+    message_queue = communicator.subscribe('test', maxlen=1)
+    message_queue.drop_warning_interval = 0.0
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        communicator.publish('test', 'a')
+        communicator.publish('test', 'b')
+        message_queue.drop_warning_interval = 3600.0
+        communicator.publish('test', 'c')
+        communicator.publish('test', 'd')
+        message_queue.drop_warning_interval = 0.0
+        communicator.publish('test', 'e')
+
+    assert len(caught) == 2
+    assert "1 oldest message(s) dropped" in str(caught[0].message)
+    assert "3 oldest message(s) dropped" in str(caught[1].message)
+    assert message_queue.get_message(block=False)['data'] == 'e'
+
+
+def test_keyed_queue_keeps_latest_per_key():
+    """
+    Test a keyed queue replaces the pending message of the same key
+    at its place and never drops other keys
+    """
+
+    communicator = PubSub()
+    message_queue = communicator.subscribe(
+        'test', maxlen=3, key=lambda data: data.partition('=')[0])
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        for message in ('A=1', 'B=1', 'A=2', 'C=1', 'A=3', 'B=2'):
+            communicator.publish('test', message)
+
+    assert message_queue.qsize() == 3
+    msgs = [message['data'] for message in message_queue.listen(block=False)]
+    assert msgs == ['A=3', 'B=2', 'C=1']
+
+    # a key can be queued again once delivered
+    communicator.publish('test', 'A=4')
+    assert message_queue.get_message(block=False)['data'] == 'A=4'
+    assert message_queue.empty()
+
+
+def test_keyed_queue_drops_oldest_key():
+    """ Test a full keyed queue drops the oldest key, with a warning """
+
+    communicator = PubSub()
+    message_queue = communicator.subscribe(
+        'test', maxlen=2, key=lambda data: data.partition('=')[0])
+    with pytest.warns(UserWarning, match="1 oldest message"):
+        for message in ('A=1', 'B=1', 'C=1'):
+            communicator.publish('test', message)
+
+    msgs = [message['data'] for message in message_queue.listen(block=False)]
+    assert msgs == ['B=1', 'C=1']
+
+
+def test_exception_bounded_queue():
+    """ Test maxlen must be positive, maxlen and key are refused with priorities """
+
+    with pytest.raises(ValueError):
+        PubSub().subscribe('test', maxlen=0)
+    with pytest.raises(ValueError):
+        PubSubPriority().subscribe_('test', True, maxlen=3)
+    with pytest.raises(ValueError):
+        PubSubPriority().subscribe_('test', True, key=str)
+
+
 @pytest.mark.parametrize("class_2_test", [PubSub, PubSubPriority])
 def test_exception_subscribe(class_2_test):
     """
@@ -111,7 +111,12 @@ class SocketManager:
             raise ValueError("dst_iface must be either bytes or str")
 
         self.is_broadcast = is_broadcast
+        # the platform and interfaces do not change at runtime, resolve them once
+        self._platform = platform.system()
+        self._same_machine = self.are_same_machines(self.src_iface, self.dst_iface)
         self._socket: Optional[socket.socket] = None
+        self._rxbuf: Optional[bytearray] = None  # receive buffer reused by receive_into()
+        self._rxview: Optional[memoryview] = None
         self._validate_interface()
 
     def _validate_interface(self) -> None:
@@ -121,12 +126,12 @@ class SocketManager:
         Raises:
             InterfaceError: If interface specification is invalid
         """
-        if platform.system() == 'Darwin' and not self.is_valid_ip(self.src_iface):
+        if self._platform == 'Darwin' and not self.is_valid_ip(self.src_iface):
             raise InterfaceError(
                 f"MacOS requires IP address, got interface name: {self.src_iface}. "
                 "Please provide IP address instead of interface name."
             )
-        if platform.system() == 'Darwin' and not self.is_valid_ip(self.dst_iface):
+        if self._platform == 'Darwin' and not self.is_valid_ip(self.dst_iface):
             raise InterfaceError(
                 f"MacOS requires IP address, got interface name: {self.dst_iface}. "
                 "Please provide IP address instead of interface name."
@@ -220,7 +225,7 @@ class SocketManager:
             timeout = self.appconfig.socket_timeout
             self._socket.settimeout(timeout)
             logging.debug('SocketManager: Set socket timeout to %s', timeout)
-            if platform.system() == 'Linux' and not self.is_valid_ip(self.src_iface):
+            if self._platform == 'Linux' and not self.is_valid_ip(self.src_iface):
                 # On Linux, bind to interface name
                 # SO_BINDTODEVICE = 25 from Linux <socket.h>
                 self._socket.setsockopt(
@@ -236,6 +241,33 @@ class SocketManager:
             logging.error('SocketManager: Failed to create socket: %s', str(e))
             raise SocketBindError(f"Failed to create socket: {str(e)}") from e
 
+    def set_receive_buffer(self, size: int) -> int:
+        """
+        Request a kernel receive buffer of the given size for the socket.
+        The kernel clamps the request to net.core.rmem_max, so the effective
+        size is read back and returned.
+
+        Args:
+            size: Requested receive buffer size in bytes
+
+        Returns:
+            int: Effective receive buffer size in bytes
+
+        Raises:
+            SocketBindError: If the socket is not created or the option cannot be set
+        """
+        if not self._socket:
+            logging.error('SocketManager: Cannot set receive buffer, socket not created')
+            raise SocketBindError("Socket not created")
+        try:
+            self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, size)
+            effective = self._socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+            logging.debug('SocketManager: Requested SO_RCVBUF %d, effective %d', size, effective)
+            return effective
+        except socket.error as e:
+            logging.error('SocketManager: Failed to set receive buffer: %s', str(e))
+            raise SocketBindError(f"Failed to set receive buffer: {str(e)}") from e
+
     def bind(self, port: int, specific_ip: Optional[str] = None) -> None:
         """
         Bind the socket to an address.
@@ -252,7 +284,7 @@ class SocketManager:
             raise SocketBindError("Socket not created")
         try:
             # On MacOS or when specific IP is provided
-            if platform.system() == 'Darwin' or specific_ip:
+            if self._platform == 'Darwin' or specific_ip:
                 bind_ip = specific_ip or self.src_iface
                 logging.debug('SocketManager: Binding to IP %s, port %d', bind_ip, port)
                 self._socket.bind((bind_ip, port))
@@ -284,14 +316,14 @@ class SocketManager:
             raise SocketBindError("Socket not created")
         try:
             # Platform-specific binding with port adjustment
-            if self.is_same_machine():
+            if self._same_machine:
                 adjusted_port = port + delta # the caller tells what delta to use if same machine
                 logging.debug('SocketManager: Same machine detected, adjusting port from %d to %d (delta: %d)',
                                   port, adjusted_port, delta)
             else:
                 adjusted_port = port
             # choose binding address based on platform (Linux/MacOS) and broadcast parameter
-            if platform.system() == 'Darwin':
+            if self._platform == 'Darwin':
                 # On MacOS, we decide based on broadcast parameter
                 if broadcast:
                     logging.debug('SocketManager: Binding to all on port %d (original port %d with delta %d)',
@@ -334,15 +366,11 @@ class SocketManager:
         if not self._socket:
             logging.error('SocketManager: Cannot send_with_delta, socket not created')
             raise SocketSendError("Socket not created")
-        platform_type = platform.system()
-        if platform_type == 'Darwin' and not self.is_valid_ip(self.src_iface):
-            # Validate IP on MacOS
-            logging.error('SocketManager: Invalid source IP for MacOS: %s', self.src_iface)
-            raise InterfaceError(f"Invalid source IP for MacOS: {self.src_iface}")
+        # MacOS source IP is already validated once in _validate_interface()
         try:
             # Platform-specific address handling
             # Calculate final port (e.g. 50000 + (-100) = 49900)
-            if self.is_same_machine():
+            if self._same_machine:
                 adjusted_port = port + delta # the caller tells what delta to use if same machine
                 logging.debug('SocketManager: Same machine detected, adjusting port from %d to %d (delta: %d)',
                                   port, adjusted_port, delta)
@@ -414,6 +442,36 @@ class SocketManager:
             logging.error('SocketManager: Failed to receive data: %s', str(e))
             raise SocketReceiveError(f"Failed to receive data: {str(e)}") from e
 
+    def receive_into(self) -> Tuple[memoryview, Tuple[str, int]]:
+        """
+        Receive data into a preallocated buffer with timeout handling.
+        The buffer is allocated once and reused for every datagram, so no
+        bytes object is created per packet.
+
+        Returns:
+            Tuple of (data, address) where data is a memoryview on the receive buffer.
+            The view is only valid until the next call to receive_into().
+
+        Raises:
+            SocketReceiveError: If receiving fails
+            SocketTimeoutError: If receive times out
+        """
+        if not self._socket:
+            logging.error('SocketManager: Cannot receive, socket not created')
+            raise SocketReceiveError("Socket not created")
+        if self._rxbuf is None or self._rxview is None:
+            self._rxbuf = bytearray(self.appconfig.buff_size)
+            self._rxview = memoryview(self._rxbuf)
+        try:
+            nbytes, address = self._socket.recvfrom_into(self._rxbuf)
+            logging.debug('SocketManager: Received %d bytes from %s:%d', nbytes, address[0], address[1])
+            return self._rxview[:nbytes], address
+        except socket.timeout as e:
+            raise SocketTimeoutError("Receive operation timed out") from e
+        except socket.error as e:
+            logging.error('SocketManager: Failed to receive data: %s', str(e))
+            raise SocketReceiveError(f"Failed to receive data: {str(e)}") from e
+
     def close(self) -> None:
         """Close the socket if it exists."""
         if self._socket:
@@ -449,4 +507,4 @@ class SocketManager:
         Returns:
             bool: True if source and destination interfaces are the same
         """
-        return self.are_same_machines(self.src_iface, self.dst_iface)
+        return self._same_machine
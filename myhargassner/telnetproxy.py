@@ -9,6 +9,7 @@ import socket
 import select
 import time
 import platform
+from queue import Empty
 from threading import Thread, Lock
 from typing import Annotated,Tuple
 import annotated_types
@@ -509,8 +510,7 @@ class TelnetProxy(ShutdownAware, ChanelReceiver, MqttBase):
 
         try:
             # Non-blocking check for new discovery messages
-            iterator = self._msq.listen(timeout=0.01)  # Very short timeout
-            message = next(iterator)
+            message = self._msq.get_message(timeout=0.01)  # Very short timeout
 
             if message:
                 msg = message['data']
@@ -525,7 +525,7 @@ class TelnetProxy(ShutdownAware, ChanelReceiver, MqttBase):
                     logging.critical('Received new HargaWebApp during active session - IGW reconnected')
                     return True
 
-        except StopIteration:
+        except Empty:
             pass  # No message, continue
 
         return False
@@ -570,7 +570,8 @@ class TelnetProxy(ShutdownAware, ChanelReceiver, MqttBase):
                 self._cleanup_and_exit('new_HargaWebApp_during_active_session')
                 return
 
-            if self._msq:
+            # qsize() is only worth calling when it is logged
+            if self._msq and logging.getLogger().isEnabledFor(logging.DEBUG):
                 logging.debug('TelnetProxy ChannelQueue size: %d', self._msq.qsize())
             try:
                 # Use configurable timeout for select to ensure shutdown responsiveness
@@ -860,8 +861,8 @@ class ThreadedTelnetProxy(Thread):
             logging.info("TelnetProxy exiting, shutting down MqttActuator...")
             if self._ma:
                 self._ma.request_shutdown()
-                self._ma._thread.join(timeout=5)  # pylint: disable=protected-access
-                if self._ma._thread.is_alive():  # pylint: disable=protected-access
+                self._ma.join(timeout=5)
+                if self._ma.is_alive():
                     logging.warning("MqttActuator did not exit cleanly")
                 self._ma = None
 
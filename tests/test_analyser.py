@@ -0,0 +1,69 @@
+"""
+Unit tests for the pm buffer handling of Analyser, with pytest
+"""
+
+from queue import Empty
+
+from myhargassner.analyser import Analyser
+from myhargassner.pubsub.pubsub import PubSub
+
+
+def _pm_buffer(count: int, offset: int = 0) -> bytes:
+    """build a pm buffer holding count fields, field i has the value i + offset"""
+    return b'pm ' + b' '.join(str(i + offset).encode() for i in range(count)) + b'\r\n'
+
+
+def _published(queue) -> dict:
+    """collect the key -> value pairs published on the info channel"""
+    values = {}
+    while True:
+        try:
+            message = queue.get_message(timeout=0.1)
+        except Empty:
+            return values
+        key, _, value = message['data'].partition('££')
+        values[key] = value
+
+
+def _analyse(analyser: Analyser, data: bytes, mode: str = '') -> str:
+    """feed one read to the analyser and return the mode to use for the next one"""
+    _, mode, _, _, _ = analyser.analyse_data_buffer(data, b'', mode, '')
+    return mode
+
+
+def test_pm_buffer_split_over_two_reads():
+    """a pm buffer received in two reads is analysed as a whole"""
+    communicator = PubSub()
+    queue = communicator.subscribe('info')
+    analyser = Analyser(communicator)
+    pm = _pm_buffer(60)
+
+    mode = _analyse(analyser, pm[:40])
+    assert mode == 'pm'
+    assert not _published(queue)
+
+    mode = _analyse(analyser, pm[40:], mode)
+    assert mode == ''
+    values = _published(queue)
+    # fields from both reads are published, at their right position
+    assert values['c0'] == '0'
+    assert values['c5'] == '8'
+    assert values['c15'] == '49'
+
+
+def test_pm_header_drops_unfinished_buffer():
+    """a new pm header discards the fragment left from an unfinished pm buffer"""
+    communicator = PubSub()
+    queue = communicator.subscribe('info')
+    analyser = Analyser(communicator)
+
+    # truncated pm buffer, never completed
+    mode = _analyse(analyser, _pm_buffer(60, offset=1000)[:40])
+    assert mode == 'pm'
+
+    mode = _analyse(analyser, _pm_buffer(60), mode)
+    assert mode == ''
+    values = _published(queue)
+    assert values['c0'] == '0'
+    assert values['c5'] == '8'
+    assert values['c15'] == '49'